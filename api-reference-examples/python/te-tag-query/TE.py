@@ -4,14 +4,26 @@
 
 # General Python dependencies
 import os
-import urllib
 import urllib.parse
-import urllib.request
-import urllib.error
 import json
-import copy
+import concurrent.futures
 import datetime
 import re
+import threading
+
+# Third-party dependencies
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: orjson parses straight from bytes and is several times faster than
+# the standard-library json module. Fall back to the latter if not installed.
+try:
+    import orjson
+
+    _jsonLoads = orjson.loads
+except ImportError:
+    _jsonLoads = json.loads
 
 # ================================================================
 # HTTP-wrapper methods
@@ -28,6 +40,37 @@ class Net:
     TE_BASE_URL = DEFAULT_TE_BASE_URL
     APP_TOKEN = None
 
+    # Descriptor fields requested by getInfoForIDs and doPowerSearch. See also
+    # https://developers.facebook.com/docs/threat-exchange/reference/apis/threat-descriptor/v6.0
+    _DESCRIPTOR_FIELDS = ",".join(
+        [
+            "raw_indicator",
+            "type",
+            "added_on",
+            "last_updated",
+            "confidence",
+            "owner",
+            "privacy_type",
+            "review_status",
+            "status",
+            "severity",
+            "share_level",
+            "tags",
+            "description",
+            "reactions",
+            "my_reactions",
+        ]
+    )
+
+    # Batch size and fan-out for getInfoForIDs
+    _MAX_IDS_PER_REQUEST = 50
+    _MAX_CONCURRENT_REQUESTS = 8
+
+    # See _getSession
+    _session = None
+    _sessionPID = None
+    _sessionLock = threading.Lock()
+
     # This is just a keystroke-saver / error-avoider for passing around
     # post-parameter field names.
 
@@ -56,6 +99,8 @@ class Net:
         "reactions": "reactions",
         "reactions_to_remove": "reactions_to_remove",
     }
+    # For membership tests when filtering down to postable fields
+    _POST_PARAM_NAME_SET = frozenset(POST_PARAM_NAMES)
 
     # ----------------------------------------------------------------
     # E.g. for overridiing
@@ -66,6 +111,21 @@ class Net:
     def setTEBaseURL(self, baseURL):
         self.TE_BASE_URL = baseURL
 
+    # ----------------------------------------------------------------
+    # Builds an endpoint URL with the access token and the given query
+    # parameters, quoting them all in a single urlencode pass. Commas are left
+    # unescaped so that ID and field lists stay readable with --show-urls.
+    @classmethod
+    def _makeURL(self, path, params=None):
+        query = {"access_token": self.APP_TOKEN}
+        if params != None:
+            query.update(params)
+        return "%s%s/?%s" % (
+            self.TE_BASE_URL,
+            path,
+            urllib.parse.urlencode(query, safe=",", quote_via=urllib.parse.quote),
+        )
+
     # ----------------------------------------------------------------
     # Gets the ThreatExchange app token from an environment variable.  Feel
     # free to replace the app-token discovery method here with whatever is
@@ -81,46 +141,97 @@ class Net:
         else:
             raise Exception("$%s not found in environment." % appTokenEnvName)
 
+    # ----------------------------------------------------------------
+    # Returns the HTTP session shared across all calls, so that paginated
+    # crawls reuse the same keep-alive TLS connection rather than doing a
+    # handshake per page. Transient server-side errors on GETs are retried
+    # with exponential backoff; POSTs are not retried since submits aren't
+    # idempotent.
+    #
+    # The session is created lazily and re-created after a fork, so that
+    # forked worker processes never share pooled sockets with their parent.
+    # See also _resetSessionAfterFork.
+    @classmethod
+    def _getSession(self):
+        with self._sessionLock:
+            if self._session == None or self._sessionPID != os.getpid():
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=4,
+                        pool_maxsize=16,
+                        max_retries=Retry(
+                            total=5,
+                            status_forcelist=[500, 502, 503, 504],
+                            allowed_methods=["HEAD", "GET", "OPTIONS"],
+                            backoff_factor=0.5,
+                            respect_retry_after_header=True,
+                            # Hand back the last 5xx so callers see an HTTPError
+                            raise_on_status=False,
+                        ),
+                    ),
+                )
+                self._session = session
+                self._sessionPID = os.getpid()
+            return self._session
+
+    # ----------------------------------------------------------------
+    # Runs in the child after a fork. Besides dropping the parent's session,
+    # this replaces the lock: if another thread held it at fork time, the
+    # child's copy would stay locked forever and _getSession would deadlock.
+    @classmethod
+    def _resetSessionAfterFork(self):
+        self._session = None
+        self._sessionPID = None
+        self._sessionLock = threading.Lock()
+
     # ----------------------------------------------------------------
     # Helper method for issuing a GET and returning the JSON payload.
     @classmethod
     def getJSONFromURL(self, url):
-        numTries = 0
-        while True:
-            numTries += 1
-            [response, error] = self.tryGET(url)
-            if response != None:
-                response = response.read()
-                # Now make it a string
-                response = response.decode("utf-8")
-                return json.loads(response)
-            elif error.code < 500 or error.code >= 600:
-                raise error
-            elif numTries > 4:
-                raise error
+        # Retries with backoff are handled by the session's adapter. The
+        # timeout is a heuristic.
+        response = self._getSession().get(url, timeout=60)
+        response.raise_for_status()
+        # Parse straight from the response bytes, so there's no need to
+        # materialize an intermediate decoded str of the whole page.
+        return _jsonLoads(response.content)
 
+    # ----------------------------------------------------------------
+    # Walks a paginated Graph API response, yielding the "data" array of each
+    # page. The GET for page N+1 is issued as soon as page N has been parsed,
+    # so the network round-trip overlaps with the caller's processing of page N.
     @classmethod
-    def tryGET(self, url):
-        try:
-            # The timeout is a heuristic
-            response = urllib.request.urlopen(url, None, 60)
-            return [response, None]
-        except urllib.error.HTTPError as e:
-            return [None, e]
+    def _prefetchPages(self, startURL, showURLs=False):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            url = startURL
+            future = executor.submit(self.getJSONFromURL, url)
+
+            while future != None:
+                response = future.result()
+
+                # Print each URL as its page is handed to the caller, so the
+                # output still reads in request order despite the prefetch.
+                if showURLs:
+                    print("URL:")
+                    print(url)
+
+                future = None
+                if "paging" in response:
+                    paging = response["paging"]
+                    if "next" in paging:
+                        url = paging["next"]
+                        future = executor.submit(self.getJSONFromURL, url)
+
+                yield response["data"]
 
     # ----------------------------------------------------------------
     # Looks up the "objective tag" ID for a given tag. This is suitable input for the /threat_tags endpoint.
 
     @classmethod
     def getTagIDFromName(self, tagName, showURLs=False):
-        url = (
-            self.TE_BASE_URL
-            + "/threat_tags"
-            + "/?access_token="
-            + self.APP_TOKEN
-            + "&text="
-            + urllib.parse.quote(tagName)
-        )
+        url = self._makeURL("/threat_tags", {"text": tagName})
         if showURLs:
             print("URL:")
             print(url)
@@ -128,8 +239,8 @@ class Net:
         response = self.getJSONFromURL(url)
 
         # The lookup will get everything that has this as a prefix.
-        # So we need to filter the results. This loop also handles the
-        # case when the results array is empty.
+        # So we need to filter the results, stopping at the first exact match.
+        # This also handles the case when the results array is empty.
         #
         # Example: when querying for "media_type_video", we want the 2nd one:
         # { "data": [
@@ -139,11 +250,7 @@ class Net:
         #   ], ...
         # }
         data = response["data"]
-        desired = list(filter(lambda o: o["text"] == tagName, data))
-        if len(desired) < 1:
-            return None
-        else:
-            return desired[0]["id"]
+        return next((o["id"] for o in data if o["text"] == tagName), None)
 
     # ----------------------------------------------------------------
     # Looks up all descriptors with a given tag. Invokes a specified callback on
@@ -158,72 +265,45 @@ class Net:
         taggedSince = kwargs.get("taggedSince", None)
         taggedUntil = kwargs.get("taggedUntil", None)
 
-        startURL = (
-            self.TE_BASE_URL
-            + "/"
-            + tagID
-            + "/tagged_objects"
-            + "/?access_token="
-            + self.APP_TOKEN
-            + "&limit="
-            + str(pageSize)
-        )
-
+        params = {"limit": pageSize}
         if taggedSince != None:
-            startURL += "&tagged_since=" + urllib.parse.quote(taggedSince)
+            params["tagged_since"] = taggedSince
         if taggedUntil != None:
-            startURL += "&tagged_until=" + urllib.parse.quote(taggedUntil)
+            params["tagged_until"] = taggedUntil
+        startURL = self._makeURL("/" + tagID + "/tagged_objects", params)
 
-        nextURL = startURL
         pageIndex = 0
 
-        while nextURL != None:
-            if showURLs:
-                print("URL:")
-                print(nextURL)
-
-            # Format we're parsing:
-            # {
-            #   "data": [
-            #     {
-            #       "id": "9915337796604770",
-            #       "type": "THREAT_DESCRIPTOR",
-            #       "name": "7ef5...aa97"
-            #     }
-            #     ...
-            #   ],
-            #   "paging": {
-            #     "cursors": {
-            #       "before": "XYZIU...NjQ0h3Unh3",
-            #       "after": "XYZIUk...FXNzVNd1Jn"
-            #     },
-            #     "next": "https://graph.facebook.com/v3.1/9999338387644295/tagged_objects?access_token=..."
-            #   }
-            # }
-
-            response = self.getJSONFromURL(nextURL)
-
-            data = response["data"]
-
-            nextURL = None
-            if "paging" in response:
-                paging = response["paging"]
-                if "next" in paging:
-                    nextURL = paging["next"]
-            ids = []
-            for item in data:
-                itemID = item["id"]
-                itemType = item["type"]
-                if includeIndicatorInOutput:
-                    itemName = item["name"]
-                else:
-                    del item["name"]
-                if itemType != self.THREAT_DESCRIPTOR:
-                    continue
-                if verbose:
-                    print(json.dumps(item))
-                ids.append(itemID)
+        # Format we're parsing:
+        # {
+        #   "data": [
+        #     {
+        #       "id": "9915337796604770",
+        #       "type": "THREAT_DESCRIPTOR",
+        #       "name": "7ef5...aa97"
+        #     }
+        #     ...
+        #   ],
+        #   "paging": {
+        #     "cursors": {
+        #       "before": "XYZIU...NjQ0h3Unh3",
+        #       "after": "XYZIUk...FXNzVNd1Jn"
+        #     },
+        #     "next": "https://graph.facebook.com/v3.1/9999338387644295/tagged_objects?access_token=..."
+        #   }
+        # }
+
+        for data in self._prefetchPages(startURL, showURLs):
+            ids = [
+                item["id"] for item in data if item["type"] == self.THREAT_DESCRIPTOR
+            ]
             if verbose:
+                for item in data:
+                    if item["type"] != self.THREAT_DESCRIPTOR:
+                        continue
+                    if not includeIndicatorInOutput:
+                        del item["name"]
+                    print(json.dumps(item))
                 info = {}
                 info["page_index"] = pageIndex
                 info["num_items_pre_filter"] = len(data)
@@ -243,55 +323,72 @@ class Net:
         includeIndicatorInOutput = kwargs.get("includeIndicatorInOutput", True)
 
         # Check well-formattedness of descriptor IDs (which may have come from
-        # arbitrary data on stdin).
-        for id in ids:
-            try:
-                _ = int(id)
-            except ValueError:
-                raise Exception('Malformed descriptor ID "%s"' % id)
+        # arbitrary data on stdin). Graph API IDs are plain ASCII digit strings.
+        malformedID = next(
+            (id for id in ids if not (id.isascii() and id.isdigit())), None
+        )
+        if malformedID != None:
+            raise Exception('Malformed descriptor ID "%s"' % malformedID)
 
         # See also
         # https://developers.facebook.com/docs/threat-exchange/reference/apis/threat-descriptor/v6.0
         # for available fields
 
-        url = (
-            self.TE_BASE_URL
-            + "/?access_token="
-            + self.APP_TOKEN
-            + "&ids="
-            + ",".join(ids)
-            + "&fields=raw_indicator,type,added_on,last_updated,confidence,owner,privacy_type,review_status,status,severity,share_level,tags,description,reactions,my_reactions"
-        )
-
-        if showURLs:
-            print("URL:")
-            print(url)
+        # The Graph API caps how many IDs a single request may ask for, so
+        # split them into batches and fetch the batches concurrently over the
+        # shared session's connection pool.
+        urls = []
+        for i in range(0, len(ids), self._MAX_IDS_PER_REQUEST):
+            url = self._makeURL(
+                "",
+                {
+                    "ids": ",".join(ids[i : i + self._MAX_IDS_PER_REQUEST]),
+                    "fields": self._DESCRIPTOR_FIELDS,
+                },
+            )
+            if showURLs:
+                print("URL:")
+                print(url)
+            urls.append(url)
 
-        response = self.getJSONFromURL(url)
+        if len(urls) <= 1:
+            responses = [self.getJSONFromURL(url) for url in urls]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(urls), self._MAX_CONCURRENT_REQUESTS)
+            ) as executor:
+                # map() keeps the batches in request order
+                responses = list(executor.map(self.getJSONFromURL, urls))
 
         descriptors = []
-        for id, descriptor in response.items():
-            if includeIndicatorInOutput == False:
-                del descriptor["raw_indicator"]
-            if verbose:
-                print(json.dumps(descriptor))
-
-            tags = descriptor.get("tags", None)
-            if tags is None:
-                tags = []
-            else:
-                tags = tags["data"]
+        for response in responses:
+            for id, descriptor in response.items():
+                if includeIndicatorInOutput == False:
+                    del descriptor["raw_indicator"]
+                if verbose:
+                    print(json.dumps(descriptor))
 
-            # Canonicalize the tag ordering and simplify the
-            # structure to simply an array of tag-texts
-            descriptor["tags"] = sorted(tag["text"] for tag in tags)
+                self._canonicalizeDescriptor(descriptor)
+                descriptors.append(descriptor)
 
-            if descriptor.get("description") is None:
-                descriptor["description"] = ""
+        return descriptors
 
-            descriptors.append(descriptor)
+    # ----------------------------------------------------------------
+    # Code-reuse for getInfoForIDs and doPowerSearch. Canonicalizes the tag
+    # ordering and simplifies the structure to simply an array of tag-texts,
+    # and defaults a missing description to the empty string.
+    @classmethod
+    def _canonicalizeDescriptor(self, descriptor):
+        tags = descriptor.get("tags", None)
+        if tags is None:
+            tags = []
+        else:
+            tags = [tag["text"] for tag in tags["data"]]
+            tags.sort()
+        descriptor["tags"] = tags
 
-        return descriptors
+        if descriptor.get("description") is None:
+            descriptor["description"] = ""
 
     # ----------------------------------------------------------------
     # See also https://developers.facebook.com/docs/threat-exchange/reference/apis/threat-descriptors
@@ -305,54 +402,19 @@ class Net:
         showURLs = options.get("showURLs", False)
         includeIndicatorInOutput = options.get("includeIndicatorInOutput", True)
 
-        startURL = (
-            self.TE_BASE_URL
-            + "/threat_descriptors"
-            + "/?access_token="
-            + self.APP_TOKEN
-            + "&fields=raw_indicator,type,added_on,last_updated,confidence,owner,privacy_type,review_status,status,severity,share_level,tags,description,reactions,my_reactions"
-        )
-
-        for key, value in urlParams.items():
-            startURL += "&" + key + "=" + urllib.parse.quote(value)
+        params = {"fields": self._DESCRIPTOR_FIELDS}
+        params.update(urlParams)
+        startURL = self._makeURL("/threat_descriptors", params)
 
-        nextURL = startURL
         pageIndex = 0
 
-        while nextURL is not None:
-            if showURLs:
-                print("URL:")
-                print(nextURL)
-
-            response = self.getJSONFromURL(nextURL)
-
-            data = response["data"]
-
-            nextURL = None
-            if "paging" in response:
-                paging = response["paging"]
-                if "next" in paging:
-                    nextURL = paging["next"]
-
+        for data in self._prefetchPages(startURL, showURLs):
             descriptors = []
             for descriptor in data:
                 if not includeIndicatorInOutput:
                     del descriptor["name"]
 
-                # Canonicalize the tag ordering and simplify the
-                # structure to simply an array of tag-texts
-                tags = descriptor.get("tags", None)
-                if tags is None:
-                    tags = []
-                else:
-                    tags = tags["data"]
-                tags = [tag["text"] for tag in tags]
-                tags.sort()
-                descriptor["tags"] = tags
-
-                if descriptor.get("description") is None:
-                    descriptor["description"] = ""
-
+                self._canonicalizeDescriptor(descriptor)
                 descriptors.append(descriptor)
 
             if verbose:
@@ -384,10 +446,10 @@ class Net:
         ]
 
         missingFields = [
-            fieldName if postParams.get(fieldName) == None else None
+            fieldName
             for fieldName in requiredFields
+            if postParams.get(fieldName) == None
         ]
-        missingFields = [fieldName for fieldName in missingFields if fieldName != None]
 
         if len(missingFields) == 0:
             return None
@@ -431,12 +493,7 @@ class Net:
         if errorMessage != None:
             return [errorMessage, None, None]
 
-        url = (
-            self.TE_BASE_URL
-            + "/threat_descriptors"
-            + "/?access_token="
-            + self.APP_TOKEN
-        )
+        url = self._makeURL("/threat_descriptors")
 
         return self._postThreatDescriptor(url, postParams, showURLs, dryRun)
 
@@ -449,13 +506,7 @@ class Net:
         if errorMessage != None:
             return [errorMessage, None, None]
 
-        url = (
-            self.TE_BASE_URL
-            + "/"
-            + postParams[self.POST_PARAM_NAMES["descriptor_id"]]
-            + "/?access_token="
-            + self.APP_TOKEN
-        )
+        url = self._makeURL("/" + postParams[self.POST_PARAM_NAMES["descriptor_id"]])
 
         return self._postThreatDescriptor(url, postParams, showURLs, dryRun)
 
@@ -473,8 +524,9 @@ class Net:
         sourceDescriptor = self.getInfoForIDs([sourceID], showURLs=showURLs)
         sourceDescriptor = sourceDescriptor[0]
 
-        # Mutate necessary fields
-        newDescriptor = copy.deepcopy(sourceDescriptor)
+        # Mutate necessary fields. Only top-level keys are added or removed
+        # below, so a shallow copy is enough.
+        newDescriptor = dict(sourceDescriptor)
         newDescriptor["indicator"] = sourceDescriptor["raw_indicator"]
         del newDescriptor["raw_indicator"]
         if "tags" in newDescriptor and newDescriptor["tags"] is None:
@@ -502,10 +554,11 @@ class Net:
 
         # Get rid of fields like last_upated from the source descriptor which
         # aren't valid for post
-        postParams = {}
-        for key, value in newDescriptor.items():
-            if self.POST_PARAM_NAMES.get(key) != None:
-                postParams[key] = value
+        postParams = {
+            key: value
+            for key, value in newDescriptor.items()
+            if key in self._POST_PARAM_NAME_SET
+        }
 
         return self.submitThreatDescriptor(postParams, showURLs, dryRun)
 
@@ -513,8 +566,9 @@ class Net:
     # Code-reuse for submit and update
     @classmethod
     def _postThreatDescriptor(self, url, postParams, showURLs, dryRun):
-        for key, value in postParams.items():
-            url += "&%s=%s" % (key, urllib.parse.quote(str(value)))
+        url += "&" + urllib.parse.urlencode(
+            postParams, safe=",", quote_via=urllib.parse.quote
+        )
         if showURLs:
             print()
             print("URL:")
@@ -523,29 +577,13 @@ class Net:
             print("Not doing POST since --dry-run.")
             return [None, None, ""]
 
-        # Encode the inputs to the POST
-        header = {"Content-Type": "text/json", "charset": "utf-8"}
-        # This is a string
-        data = urllib.parse.urlencode(postParams)
-        # Turn it into a Python bytes object
-        data = data.encode("ascii")
-
-        # Do the POST
+        # Do the POST. The session form-encodes the inputs for us.
+        response = self._getSession().post(url, data=postParams)
+        responseBody = _jsonLoads(response.content)
         try:
-            response = urllib.request.urlopen(url, data)
-
-            # Decode the outputs from the POST
-            # This is a Python 'bytes'
-            response = response.read()
-            # Now make it a string
-            response = response.decode("utf-8")
-            responseBody = json.loads(response)
-            responseCode = None
-
+            response.raise_for_status()
             return [None, None, responseBody]
-
-        except urllib.error.HTTPError as e:
-            responseBody = json.loads(e.read().decode("utf-8"))
+        except requests.HTTPError as e:
             return [None, e, responseBody]
 
     # ----------------------------------------------------------------
@@ -586,10 +624,17 @@ class Net:
         "%Y-%m-%dT%H:%M:%SZ",
     ]
 
+    # All of the above start with a four-digit year and a date separator.
+    # Checking this first lets relative-time and other non-date inputs skip
+    # the failing strptime calls (and their exceptions) entirely.
+    _DATETIME_PREFIX_PATTERN = re.compile("^[0-9]{4}[-/][0-9]")
+
     # Helper for parseTimeStringToEpochSeconds to try various format-string
     # timestamps
     @classmethod
     def _parseDateTimeStringToEpochSeconds(self, mixedString):
+        if self._DATETIME_PREFIX_PATTERN.match(mixedString) == None:
+            return None
         for formatString in self.DATETIME_FORMATS:
             retval = self._parseDateTimeStringSingleFormat(mixedString, formatString)
             if retval != None:
@@ -607,82 +652,35 @@ class Net:
         except ValueError:
             return None
 
+    # Matches relative-time indications like "-3hours" or "-1week". The unit
+    # is mapped to the corresponding datetime.timedelta keyword argument.
+    _RELATIVE_TIME_PATTERN = re.compile("^-([0-9]+)(minute|hour|day|week)s?$")
+    _RELATIVE_TIME_UNITS = {
+        "minute": "minutes",
+        "hour": "hours",
+        "day": "days",
+        "week": "weeks",
+    }
+
     # Helper for parseTimeStringToEpochSeconds to try various relative-time
     # indications
     @classmethod
     def _parseRelativeStringToEpochSeconds(self, mixedString):
-        retval = self._parseRelativeStringMinute(mixedString)
-        if retval != None:
-            return retval
-        retval = self._parseRelativeStringHour(mixedString)
-        if retval != None:
-            return retval
-        retval = self._parseRelativeStringDay(mixedString)
-        if retval != None:
-            return retval
-        retval = self._parseRelativeStringWeek(mixedString)
-        if retval != None:
-            return retval
-        return None
-
-    # Helper for parseTimeStringToEpochSeconds to try particular relative-time
-    # indications.
-    @classmethod
-    def _parseRelativeStringMinute(self, mixedString):
-        pattern = re.compile("^-([0-9]+)minutes?$")
-        output = pattern.match(mixedString)
-        if output != None:
-            count = int(output.group(1))
-            return int(
-                (
-                    datetime.datetime.today() - datetime.timedelta(minutes=count)
-                ).timestamp()
-            )
-        return None
-
-    # Helper for parseTimeStringToEpochSeconds to try particular relative-time
-    # indications.
-    @classmethod
-    def _parseRelativeStringHour(self, mixedString):
-        pattern = re.compile("^-([0-9]+)hours?$")
-        output = pattern.match(mixedString)
-        if output != None:
-            count = int(output.group(1))
-            return int(
-                (
-                    datetime.datetime.today() - datetime.timedelta(hours=count)
-                ).timestamp()
-            )
-        return None
-
-    # Helper for parseTimeStringToEpochSeconds to try particular relative-time
-    # indications.
-    @classmethod
-    def _parseRelativeStringDay(self, mixedString):
-        pattern = re.compile("^-([0-9]+)days?$")
-        output = pattern.match(mixedString)
-        if output != None:
-            count = int(output.group(1))
-            return int(
-                (datetime.datetime.today() - datetime.timedelta(days=count)).timestamp()
-            )
-        return None
+        output = self._RELATIVE_TIME_PATTERN.match(mixedString)
+        if output == None:
+            return None
+        count = int(output.group(1))
+        unit = self._RELATIVE_TIME_UNITS[output.group(2)]
+        return int(
+            (
+                datetime.datetime.today() - datetime.timedelta(**{unit: count})
+            ).timestamp()
+        )
 
-    # Helper for parseTimeStringToEpochSeconds to try particular relative-time
-    # indications.
-    @classmethod
-    def _parseRelativeStringWeek(self, mixedString):
-        pattern = re.compile("^-([0-9]+)weeks?$")
-        output = pattern.match(mixedString)
-        if output != None:
-            count = int(output.group(1))
-            return int(
-                (
-                    datetime.datetime.today() - datetime.timedelta(weeks=count)
-                ).timestamp()
-            )
-        return None
 
+# os.register_at_fork is POSIX-only; elsewhere there is no fork to worry about.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Net._resetSessionAfterFork)
 
 # ================================================================
 # Validator for client-side creation-time datetime parsing. Not written as unit
@@ -1,6 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
 import csv
+import dataclasses
 import os
 import os.path
 import shutil
@@ -27,8 +28,8 @@ app.config.from_object(config_helper)
 
 if config_helper.DEBUG:
     app.logger.info("Config Values:")
-    for name in config_cls._fields:
-        app.logger.info("%s = %s", name, app.config[name])
+    for field in dataclasses.fields(config_cls):
+        app.logger.info("%s = %s", field.name, app.config[field.name])
 
 
 #################### VARIOUS ENDPOINTS ####################
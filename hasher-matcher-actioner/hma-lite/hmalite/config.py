@@ -1,5 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
+import dataclasses
+import functools
 import os
 import os.path
 import sys
@@ -8,12 +10,13 @@ import typing as t
 from flask import current_app
 
 
-class HmaLiteConfig(t.NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class HmaLiteConfig:
     """
     Flask configs are a bit derpy, do what they should have done.
 
     Allows typing, as well as smart loading from environment, though
-    that only works with types that can take a str as an argument
+    that only works with the field types in _ENV_CASTERS
     """
 
     DEBUG: bool = True
@@ -28,17 +31,19 @@ class HmaLiteConfig(t.NamedTuple):
 
     @classmethod
     def init_with_environ(cls) -> "HmaLiteConfig":
-        kwargs = {}
-        # Behold, I am a great and terrible magician
-        for name, py_type in cls._field_types.items():  # May break in future versions
-            if name in os.environ:
-                kwargs[name] = py_type(os.environ[name])
-        return cls(**kwargs)
+        return cls(
+            **{
+                name: cast(os.environ[name])
+                for name, cast in _ENV_FIELDS
+                if name in os.environ
+            }
+        )
 
     @classmethod
     def from_flask_current_app(cls) -> "HmaLiteConfig":
         """Init from current flask config"""
-        return cls(**{k: v for k, v in current_app.config.items() if k in cls._fields})
+        names = {field.name for field in dataclasses.fields(cls)}
+        return cls(**{k: v for k, v in current_app.config.items() if k in names})
 
     # Helper methods
     def create_dirs(self):
@@ -50,7 +55,9 @@ class HmaLiteConfig(t.NamedTuple):
             return path
         return ""
 
-    @property
+    # Pure path computations are cached per instance. Existence checks are not,
+    # since the local index file can be created while the app is running.
+    @functools.cached_property
     def upload_folder(self):
         return os.path.join(self.STATE_DIR, self.UPLOADS_FOLDER)
 
@@ -62,7 +69,7 @@ class HmaLiteConfig(t.NamedTuple):
             index_f = self._exists(self.INDEX_FILE) or self.local_index_file
         return csv_f, index_f
 
-    @property
+    @functools.cached_property
     def local_index_file_path(self):
         return os.path.join(self.STATE_DIR, "index.te")
 
@@ -72,6 +79,24 @@ class HmaLiteConfig(t.NamedTuple):
         return self._exists(self.local_index_file_path)
 
 
+def _str_to_bool(s: str) -> bool:
+    return s.lower() in ("1", "true", "yes")
+
+
+# How to turn an environment variable str into each supported field type
+_ENV_CASTERS: t.Dict[t.Type, t.Callable[[str], t.Any]] = {
+    bool: _str_to_bool,
+    str: str,
+    int: int,
+}
+
+# Behold, I am a great and terrible magician
+_ENV_FIELDS = tuple(
+    (name, _ENV_CASTERS[py_type])
+    for name, py_type in HmaLiteConfig.__annotations__.items()
+)
+
+
 class HmaLiteProdConfig(HmaLiteConfig):
     pass
 
@@ -9,71 +9,80 @@ import functools
 import json
 import typing as t
 
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
 from hmalib.common.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class AWSSecrets:
+@functools.lru_cache(maxsize=None)
+def _get_secrets_client():
     """
-    A class for reading secrets stored in aws
+    Shared across calls (and warm lambda invocations) so the client is only
+    built once per container.
     """
+    return boto3.client("secretsmanager", config=BOTO_CLIENT_CONFIG)
+
 
-    secrets_client: t.Any
+def te_api_key() -> str:
+    """
+    get the ThreatExchange API Key.
+    Requires THREAT_EXCHANGE_API_TOKEN_SECRET_NAME be present in environ
+    else returns empty string.
+    """
+    secret_name = os.environ.get("THREAT_EXCHANGE_API_TOKEN_SECRET_NAME")
+    if not secret_name:
+        logger.warning("Unable to load THREAT_EXCHANGE_API_TOKEN_SECRET_NAME from env")
+        return ""
+    return _get_str_secret(secret_name)
 
-    def __init__(self):
-        session = boto3.session.Session()
-        self.secrets_client = session.client(service_name="secretsmanager")
+
+def hma_api_tokens() -> t.List[str]:
+    """
+    get the set of API tokens for auth of the HMA API.
+    Requires HMA_ACCESS_TOKEN_SECRET_NAME be present in environ
+    else returns empty list.
+    """
+    secret_name = os.environ.get("HMA_ACCESS_TOKEN_SECRET_NAME")
+    if not secret_name:
+        logger.warning("Unable to load HMA_ACCESS_TOKEN_SECRET_NAME from env")
+        return []
+    access_tokens = _get_str_secret(secret_name)
+    return json.loads(access_tokens)
+
+
+def _get_bin_secret(secret_name: str) -> bytes:
+    """
+    For secerts stored in AWS Secrets Manager as binary
+    """
+    response = _get_secret_value_response(secret_name)
+    return base64.b64decode(response["SecretBinary"])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_str_secret(secret_name: str) -> str:
+    """
+    For secerts stored in AWS Secrets Manager as strings
+
+    These only change on rotation, so fetch each one at most once per container.
+    """
+    response = _get_secret_value_response(secret_name)
+    return response["SecretString"]
+
+
+def _get_secret_value_response(secret_name: str):
+    return _get_secrets_client().get_secret_value(SecretId=secret_name)
+
+
+class AWSSecrets:
+    """
+    Deprecated: use the module-level functions instead.
+
+    Kept so existing `AWSSecrets().te_api_key()` style callers keep working.
+    """
 
     def te_api_key(self) -> str:
-        """
-        get the ThreatExchange API Key.
-        Requires THREAT_EXCHANGE_API_TOKEN_SECRET_NAME be present in environ
-        else returns empty string.
-        """
-        secret_name = os.environ.get("THREAT_EXCHANGE_API_TOKEN_SECRET_NAME")
-        if not secret_name:
-            logger.warning(
-                "Unable to load THREAT_EXCHANGE_API_TOKEN_SECRET_NAME from env"
-            )
-            return ""
-        api_key = self._get_str_secret(secret_name)
-        return api_key
-
-    @functools.lru_cache(maxsize=1)
+        return te_api_key()
+
     def hma_api_tokens(self) -> t.List[str]:
-        """
-        get the set of API tokens for auth of the HMA API.
-        Requires HMA_ACCESS_TOKEN_SECRET_NAME be present in environ
-        else returns empty list.
-        """
-        secret_name = os.environ.get("HMA_ACCESS_TOKEN_SECRET_NAME")
-        if not secret_name:
-            logger.warning("Unable to load HMA_ACCESS_TOKEN_SECRET_NAME from env")
-            return []
-        access_tokens = self._get_str_secret(secret_name)
-        return json.loads(access_tokens)
-
-    def _get_bin_secret(self, secret_name: str) -> bytes:
-        """
-        For secerts stored in AWS Secrets Manager as binary
-        """
-        response = self._get_secret_value_response(secret_name)
-        decoded_binary_secret = base64.b64decode(
-            self._get_secret_value_response("SecretBinary")
-        )
-        return decoded_binary_secret
-
-    def _get_str_secret(self, secret_name: str) -> str:
-        """
-        For secerts stored in AWS Secrets Manager as strings
-        """
-        response = self._get_secret_value_response(secret_name)
-        str_response = response["SecretString"]
-        return str_response
-
-    def _get_secret_value_response(self, secret_name: str):
-        get_secret_value_response = self.secrets_client.get_secret_value(
-            SecretId=secret_name
-        )
-        return get_secret_value_response
+        return hma_api_tokens()
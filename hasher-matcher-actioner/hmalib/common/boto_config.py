@@ -0,0 +1,17 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+"""
+Shared botocore configuration for boto3 clients and resources created by
+the lambdas.
+"""
+
+from botocore.config import Config
+
+# Keep connections alive between warm invocations, allow enough pooled
+# connections for concurrent use of a single client, and back off client-side
+# when AWS starts throttling instead of retrying at full speed.
+BOTO_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
@@ -18,6 +18,7 @@ import boto3
 from boto3.dynamodb.conditions import Attr
 
 from hmalib.common.aws_dataclass import py_to_aws, aws_to_py
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
 
 T = t.TypeVar("T")
 TConfig = t.TypeVar("TConfig", bound="HMAConfig")
@@ -48,7 +49,7 @@ def get_dynamodb():
     function. This is only ever used for meta.client, so maybe it would be
     better to use that. Probably not thread safe.
     """
-    return boto3.resource("dynamodb")
+    return boto3.resource("dynamodb", config=BOTO_CLIENT_CONFIG)
 
 
 @dataclass
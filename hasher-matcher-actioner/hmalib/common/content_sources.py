@@ -5,6 +5,8 @@ import boto3
 import requests
 import typing as t
 
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
+
 
 class ContentSource:
     """
@@ -22,7 +24,7 @@ class ContentSource:
 @functools.lru_cache(maxsize=None)
 def _get_s3_client():
     # memoized so that we don't create a boto3 client unless needed.
-    return boto3.client("s3")
+    return boto3.client("s3", config=BOTO_CLIENT_CONFIG)
 
 
 class S3BucketContentSource(ContentSource):
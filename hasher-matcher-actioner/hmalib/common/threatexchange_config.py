@@ -4,7 +4,7 @@
 Helpers for sync privacy groups between ThreatExchange and DynamoDB
 """
 
-from hmalib.aws_secrets import AWSSecrets
+from hmalib import aws_secrets
 from threatexchange.api import ThreatExchangeAPI
 from hmalib.common.logging import get_logger
 from hmalib.common import config as hmaconfig
@@ -55,7 +55,7 @@ def create_privacy_group_if_not_exists(
 
 
 def sync_privacy_groups():
-    api_key = AWSSecrets().te_api_key()
+    api_key = aws_secrets.te_api_key()
     api = ThreatExchangeAPI(api_key)
     privacy_group_member_list = api.get_threat_privacy_groups_member()
     privacy_group_owner_list = api.get_threat_privacy_groups_owner()
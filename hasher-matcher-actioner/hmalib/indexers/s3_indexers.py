@@ -16,6 +16,7 @@ from mypy_boto3_s3.type_defs import MetricsAndOperatorTypeDef
 from threatexchange.signal_type.signal_base import TrivialSignalTypeIndex
 from threatexchange.signal_type.pdq_index import PDQIndex
 
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
 from hmalib.common.logging import get_logger
 from hmalib import metrics
 
@@ -24,7 +25,7 @@ logger = get_logger(__name__)
 
 @functools.lru_cache(maxsize=None)
 def get_s3_client():
-    return boto3.client("s3")
+    return boto3.client("s3", config=BOTO_CLIENT_CONFIG)
 
 
 class S3BackedInstrumentedIndexMixin:
@@ -9,7 +9,7 @@ import base64
 import functools
 from jwt.algorithms import RSAAlgorithm
 
-from hmalib.aws_secrets import AWSSecrets
+from hmalib import aws_secrets
 from hmalib.common.logging import get_logger
 
 USER_POOL_URL = os.environ["USER_POOL_URL"]
@@ -61,7 +61,7 @@ def validate_jwt(token: str):
 @functools.lru_cache(maxsize=10)
 def validate_access_token(token: str) -> bool:
 
-    access_tokens = AWSSecrets().hma_api_tokens()
+    access_tokens = aws_secrets.hma_api_tokens()
     if not access_tokens or not token:
         logger.debug("No access tokens found")
         return False
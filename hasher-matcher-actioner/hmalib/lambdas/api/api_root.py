@@ -3,6 +3,7 @@
 import os
 import bottle
 import boto3
+import functools
 import json
 import typing as t
 from apig_wsgi import make_lambda_handler
@@ -12,7 +13,12 @@ from mypy_boto3_dynamodb.service_resource import Table
 
 from threatexchange.content_type.photo import PhotoContent
 
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
 from hmalib.common.logging import get_logger
+from hmalib.common.messages.submit import (
+    S3ImageSubmissionBatchMessage,
+    URLSubmissionMessage,
+)
 from hmalib.common.models.content import ContentRefType, ContentType
 
 
@@ -21,13 +27,14 @@ from hmalib.lambdas.api.action_rules import get_action_rules_api
 from hmalib.lambdas.api.actions import get_actions_api
 from hmalib.lambdas.api.content import get_content_api
 from hmalib.lambdas.api.datasets import get_datasets_api
-from hmalib.lambdas.api.matches import get_matches_api
+from hmalib.lambdas.api.matches import get_matches_api, warmup_matches_api
 from hmalib.lambdas.api.stats import get_stats_api
 from hmalib.lambdas.api.submit import (
+    SQS_MAX_BATCH_SIZE,
     get_submit_api,
     create_presigned_url,
     record_content_submission,
-    send_submission_to_url_queue,
+    send_submissions_to_url_queue,
 )
 
 # Set to 10MB for images
@@ -38,8 +45,7 @@ apig_wsgi_handler = make_lambda_handler(app)
 
 logger = get_logger(__name__)
 
-s3_client = boto3.client("s3")
-dynamodb = boto3.resource("dynamodb")
+dynamodb = boto3.resource("dynamodb", config=BOTO_CLIENT_CONFIG)
 
 THREAT_EXCHANGE_DATA_BUCKET_NAME = os.environ["THREAT_EXCHANGE_DATA_BUCKET_NAME"]
 THREAT_EXCHANGE_DATA_FOLDER = os.environ["THREAT_EXCHANGE_DATA_FOLDER"]
@@ -55,26 +61,58 @@ HASHES_QUEUE_URL = os.environ["HASHES_QUEUE_URL"]
 INDEXES_BUCKET_NAME = os.environ["INDEXES_BUCKET_NAME"]
 WRITEBACK_QUEUE_URL = os.environ["WRITEBACKS_QUEUE_URL"]
 
+# Downloading the match indexes during init costs every cold start time and
+# memory, even those that never serve /matches/, so it is opt-in.
+PRELOAD_MATCH_INDEXES = os.getenv("PRELOAD_MATCH_INDEXES", "False") in ["True", "1"]
+
+# Shared by all the mounted APIs rather than each building its own
+datastore_table = dynamodb.Table(DYNAMODB_TABLE)
+banks_table = dynamodb.Table(BANKS_TABLE)
+
+# Error bodies are constant, so serialize them once
+_ERROR_404_JSON = json.dumps({"error": "404"})
+_ERROR_405_JSON = json.dumps({"error": "405"})
+_ERROR_500_JSON = json.dumps({"error": "500"})
+
 # Override common errors codes to return json instead of bottle's default html
 @error(404)
 def error404(e):
     logger.error(f"{e}")
     response.content_type = "application/json"
-    return json.dumps({"error": "404"})
+    return _ERROR_404_JSON
 
 
 @error(405)
 def error405(e):
     logger.error(f"{e}")
     response.content_type = "application/json"
-    return json.dumps({"error": "405"})
+    return _ERROR_405_JSON
 
 
 @error(500)
 def error500(e):
     logger.exception("Exception raised", exc_info=e.exception)
     response.content_type = "application/json"
-    return json.dumps({"error": "500"})
+    return _ERROR_500_JSON
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lambda_client():
+    """
+    Only the / endpoint needs this, so don't build it for every cold start.
+    """
+    return boto3.client("lambda", config=BOTO_CLIENT_CONFIG)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_last_modified(function_arn: str) -> str:
+    """
+    LastModified only changes on deploy, which replaces the running containers,
+    so it is safe to look up once per container.
+    """
+    return _get_lambda_client().get_function_configuration(FunctionName=function_arn)[
+        "LastModified"
+    ]
 
 
 @app.get("/")
@@ -84,10 +122,7 @@ def root():
     """
     context = bottle.request.environ.get("apig_wsgi.context")
     invoked_function_arn = context.invoked_function_arn
-    client = boto3.client("lambda")
-    last_modified = client.get_function_configuration(
-        FunctionName=invoked_function_arn
-    )["LastModified"]
+    last_modified = _get_last_modified(invoked_function_arn)
 
     return {
         "message": "Welcome to the HMA API!",
@@ -105,6 +140,11 @@ def lambda_handler(event, context):
     fed directly into the system. When an upload occurs, this lambda is invoked with an s3 event. We then
     convert the event into a URL which we submit to the hasher (via SNS)
     """
+    # API Gateway events always carry requestContext and S3 events never do,
+    # so the common API path can skip classifying the event.
+    if "requestContext" in event:
+        return apig_wsgi_handler(event, context)
+
     if is_s3_event(event):
         logger.info(
             "Lambda triggered with S3 event. Converting to submit content request."
@@ -116,32 +156,57 @@ def lambda_handler(event, context):
 
 
 def is_s3_event(event: dict) -> bool:
-    return "Records" in event and all("s3" in record for record in event["Records"])
+    # S3 never mixes record types in one notification, so the first record is
+    # enough to classify the event.
+    return S3ImageSubmissionBatchMessage.could_be(event)
 
 
 def process_s3_event(event: dict) -> None:
-    for record in event["Records"]:
-        record = record["s3"]
-        if record["object"]["size"] == 0:
-            # ignore folders and empty files
-            continue
-        submit_content_request_from_s3_event_record(
-            record,
-            dynamodb_table=dynamodb.Table(DYNAMODB_TABLE),
-            submissions_queue_url=SUBMISSIONS_QUEUE_URL,
-        )
-        logger.info(f"Sucessfully submitted s3 event record as url upload.")
+    pending: t.List[URLSubmissionMessage] = []
+    submitted = 0
+    try:
+        for record in event["Records"]:
+            record = record["s3"]
+            if record["object"]["size"] == 0:
+                # ignore folders and empty files
+                continue
+            pending.append(
+                submit_content_request_from_s3_event_record(
+                    record,
+                    dynamodb_table=datastore_table,
+                )
+            )
+
+            # One SQS call per batch of records rather than one per record
+            if len(pending) == SQS_MAX_BATCH_SIZE:
+                batch, pending = pending, []
+                send_submissions_to_url_queue(SUBMISSIONS_QUEUE_URL, batch)
+                submitted += len(batch)
+    finally:
+        # These records are already in dynamodb. Queue them even if a later
+        # record failed, otherwise they are never hashed; a retry of the event
+        # would create new content ids rather than reuse these.
+        send_submissions_to_url_queue(SUBMISSIONS_QUEUE_URL, pending)
+        submitted += len(pending)
+
+    logger.info(f"Sucessfully submitted {submitted} s3 event records as url uploads.")
+
+
+# Characters in s3 keys that would need escaping in a content id
+_READABLE_KEY_TRANSLATION = str.maketrans({"?": ".", "&": "."})
 
 
 def submit_content_request_from_s3_event_record(
     record: dict,
     dynamodb_table: Table,
-    submissions_queue_url: str,
-):
+) -> URLSubmissionMessage:
     """
     Converts s3 event into a ContentObject and url_submission_message using helpers
     from submit.py
 
+    The ContentObject is recorded right away. The url_submission_message is
+    returned rather than sent so that process_s3_event can batch the SQS sends.
+
     For partner bucket uploads, the content IDs are unique and (somewhat) readable but
     not reversable
       * uniqueness is provided by uuid4 which has a collision rate of 2^-36
@@ -158,7 +223,7 @@ def submit_content_request_from_s3_event_record(
     bucket: str = record["bucket"]["name"]
     key: str = record["object"]["key"]
 
-    readable_key = key.split("/")[-1].replace("?", ".").replace("&", ".")
+    readable_key = key.rsplit("/", 1)[-1].translate(_READABLE_KEY_TRANSLATION)
     content_id = f"{uuid4()}-{readable_key}"
 
     presigned_url = create_presigned_url(bucket, key, None, 3600, "get_object")
@@ -172,8 +237,8 @@ def submit_content_request_from_s3_event_record(
         content_ref_type=ContentRefType.URL,
         additional_fields={f"partner_s3_reference_url:{reference_url}"},
     )
-    send_submission_to_url_queue(
-        dynamodb_table, submissions_queue_url, content_id, PhotoContent, presigned_url
+    return URLSubmissionMessage(
+        content_type=PhotoContent, content_id=content_id, url=t.cast(str, presigned_url)
     )
 
 
@@ -185,7 +250,7 @@ app.mount(
 app.mount(
     "/matches/",
     get_matches_api(
-        dynamodb_table=dynamodb.Table(DYNAMODB_TABLE),
+        dynamodb_table=datastore_table,
         hma_config_table=HMA_CONFIG_TABLE,
         indexes_bucket_name=INDEXES_BUCKET_NAME,
         writeback_queue_url=WRITEBACK_QUEUE_URL,
@@ -195,7 +260,7 @@ app.mount(
 app.mount(
     "/content/",
     get_content_api(
-        dynamodb_table=dynamodb.Table(DYNAMODB_TABLE),
+        dynamodb_table=datastore_table,
         image_bucket=IMAGE_BUCKET_NAME,
         image_prefix=IMAGE_PREFIX,
     ),
@@ -204,7 +269,7 @@ app.mount(
 app.mount(
     "/submit/",
     get_submit_api(
-        dynamodb_table=dynamodb.Table(DYNAMODB_TABLE),
+        dynamodb_table=datastore_table,
         image_bucket=IMAGE_BUCKET_NAME,
         image_prefix=IMAGE_PREFIX,
         submissions_queue_url=SUBMISSIONS_QUEUE_URL,
@@ -216,21 +281,26 @@ app.mount(
     "/datasets/",
     get_datasets_api(
         hma_config_table=HMA_CONFIG_TABLE,
-        datastore_table=dynamodb.Table(DYNAMODB_TABLE),
+        datastore_table=datastore_table,
         threat_exchange_data_bucket_name=THREAT_EXCHANGE_DATA_BUCKET_NAME,
         threat_exchange_data_folder=THREAT_EXCHANGE_DATA_FOLDER,
         threat_exchange_pdq_file_extension=THREAT_EXCHANGE_PDQ_FILE_EXTENSION,
     ),
 )
 
-app.mount("/stats/", get_stats_api(dynamodb_table=dynamodb.Table(DYNAMODB_TABLE)))
+app.mount("/stats/", get_stats_api(dynamodb_table=datastore_table))
 
 app.mount(
     "/actions/",
     get_actions_api(hma_config_table=HMA_CONFIG_TABLE),
 )
 
-app.mount("/banks/", get_bank_api(dynamodb.Table(BANKS_TABLE)))
+app.mount("/banks/", get_bank_api(banks_table))
+
+if PRELOAD_MATCH_INDEXES:
+    # Do the expensive lazy loading now, during init, rather than on the first
+    # request that needs it.
+    warmup_matches_api(INDEXES_BUCKET_NAME)
 
 if __name__ == "__main__":
     app.run()
@@ -22,11 +22,12 @@ from hmalib.common.models.content import (
     ContentRefType,
 )
 from hmalib.common.content_sources import S3BucketContentSource
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
 from hmalib.common.logging import get_logger
 
 logger = get_logger(__name__)
-s3_client = boto3.client("s3")
-dynamodb = boto3.resource("dynamodb")
+s3_client = boto3.client("s3", config=BOTO_CLIENT_CONFIG)
+dynamodb = boto3.resource("dynamodb", config=BOTO_CLIENT_CONFIG)
 
 
 @dataclass
@@ -26,6 +26,7 @@ from hmalib.common.models.signal import (
     ThreatExchangeSignalMetadata,
     PendingThreatExchangeOpinionChange,
 )
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
 from hmalib.common.logging import get_logger
 from hmalib.common.messages.match import BankedSignal
 from hmalib.common.messages.writeback import WritebackMessage
@@ -43,7 +44,7 @@ logger = get_logger(__name__)
 
 @functools.lru_cache(maxsize=None)
 def _get_sqs_client() -> SQSClient:
-    return boto3.client("sqs")
+    return boto3.client("sqs", config=BOTO_CLIENT_CONFIG)
 
 
 @functools.lru_cache(maxsize=None)
@@ -54,6 +55,26 @@ def _get_matcher(index_bucket_name: str) -> Matcher:
     )
 
 
+def warmup_matches_api(indexes_bucket_name: str) -> None:
+    """
+    Pull the indexes used by /matches/ into memory. Meant to be called while
+    the lambda is initializing so the first request does not pay for the
+    download.
+
+    Failures are logged and swallowed; the index will be loaded on first use
+    instead. Does nothing if no bucket is configured.
+    """
+    if not indexes_bucket_name:
+        return
+
+    matcher = _get_matcher(indexes_bucket_name)
+    for signal_type in matcher.supported_signal_types:
+        try:
+            matcher.get_index(signal_type)
+        except Exception:
+            logger.exception(f"Unable to preload index for {signal_type.__name__}")
+
+
 @dataclass
 class MatchSummary(JSONifiable):
     content_id: str
@@ -1,6 +1,6 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
-import json
+import orjson
 import typing as t
 import bottle
 
@@ -63,6 +63,15 @@ class DictParseable:
         raise NotImplementedError
 
 
+def _dump_response_json(obj: t.Any) -> bytes:
+    """
+    Serialize a response payload. orjson is several times faster than json for
+    the larger list payloads and produces bytes that bottle can send as-is.
+    OPT_NON_STR_KEYS keeps json.dumps' handling of non-str dict keys.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
 def jsoninator(
     view_fn_or_request_type: t.Union[
         t.Callable[[int, int], JSONifiable], t.Type[DictParseable]
@@ -134,7 +143,7 @@ def jsoninator(
                 response_object = view_fn(request_object, *args, **kwargs)
 
                 bottle.response.content_type = "application/json"
-                return json.dumps(response_object.to_json())
+                return _dump_response_json(response_object.to_json())
 
             return wrapper
 
@@ -151,6 +160,6 @@ def jsoninator(
             body = view_fn(*args, **kwargs)
 
             bottle.response.content_type = "application/json"
-            return json.dumps(body.to_json())
+            return _dump_response_json(body.to_json())
 
         return wrapper
@@ -7,10 +7,12 @@ import base64
 import json
 import datetime
 import dataclasses
+import itertools
 
 from enum import Enum
 from dataclasses import dataclass, asdict
 from mypy_boto3_dynamodb.service_resource import Table
+from mypy_boto3_s3 import Client as S3Client
 from mypy_boto3_sqs import SQSClient
 from botocore.exceptions import ClientError
 import typing as t
@@ -26,16 +28,25 @@ from threatexchange.content_type.meta import (
 from hmalib.lambdas.api.middleware import jsoninator, JSONifiable, DictParseable
 from hmalib.common.content_sources import S3BucketContentSource
 from hmalib.common.models.content import ContentObject, ContentRefType
+from hmalib.common.boto_config import BOTO_CLIENT_CONFIG
 from hmalib.common.logging import get_logger
 from hmalib.common.messages.submit import URLSubmissionMessage
 from hmalib.common.models.pipeline import PipelineHashRecord
 
 logger = get_logger(__name__)
 
+# SQS limit on the number of entries in a single SendMessageBatch call
+SQS_MAX_BATCH_SIZE = 10
+
 
 @functools.lru_cache(maxsize=None)
 def _get_sqs_client() -> SQSClient:
-    return boto3.client("sqs")
+    return boto3.client("sqs", config=BOTO_CLIENT_CONFIG)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3_client() -> S3Client:
+    return boto3.client("s3", config=BOTO_CLIENT_CONFIG)
 
 
 def create_presigned_put_url(bucket_name, key, file_type, expiration=3600):
@@ -47,7 +58,6 @@ def create_presigned_url(bucket_name, key, file_type, expiration, client_method)
     Generate a presigned URL to share an S3 object
     """
 
-    s3_client = boto3.client("s3")
     params = {
         "Bucket": bucket_name,
         "Key": key,
@@ -56,7 +66,7 @@ def create_presigned_url(bucket_name, key, file_type, expiration, client_method)
         params["ContentType"] = file_type
 
     try:
-        response = s3_client.generate_presigned_url(
+        response = _get_s3_client().generate_presigned_url(
             client_method,
             Params=params,
             ExpiresIn=expiration,
@@ -220,9 +230,6 @@ def send_submission_to_url_queue(
 ):
     """
     Send a submitted url of content to the hasher. This does not store a copy of the content in s3
-
-    This function is also called directly by api_root when handling s3 uploads to partner
-    banks. If editing, ensure the logic in api_root.process_s3_event is still correct
     """
 
     url_submission_message = URLSubmissionMessage(
@@ -234,6 +241,46 @@ def send_submission_to_url_queue(
     )
 
 
+def send_submissions_to_url_queue(
+    submissions_queue_url: str,
+    url_submission_messages: t.Iterable[URLSubmissionMessage],
+):
+    """
+    Batched version of send_submission_to_url_queue for callers submitting
+    many urls at once. Sends up to SQS_MAX_BATCH_SIZE messages per SQS call.
+
+    This function is called directly by api_root when handling s3 uploads to partner
+    banks. If editing, ensure the logic in api_root.process_s3_event is still correct
+    """
+    messages = iter(url_submission_messages)
+    while True:
+        batch = list(itertools.islice(messages, SQS_MAX_BATCH_SIZE))
+        if not batch:
+            return
+        response = _get_sqs_client().send_message_batch(
+            QueueUrl=submissions_queue_url,
+            Entries=[
+                {
+                    "Id": str(i),
+                    "MessageBody": json.dumps(message.to_sqs_message()),
+                }
+                for i, message in enumerate(batch)
+            ],
+        )
+        # Unlike send_message, partial failures are reported rather than raised
+        failed = response.get("Failed", [])
+        if failed:
+            failed_content_ids = [batch[int(f["Id"])].content_id for f in failed]
+            logger.error(
+                "Failed to send url submissions for %s: %s",
+                failed_content_ids,
+                failed,
+            )
+            raise RuntimeError(
+                f"Failed to send url submissions for {failed_content_ids}"
+            )
+
+
 def get_submit_api(
     dynamodb_table: Table,
     image_bucket: str,
@@ -0,0 +1,130 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import importlib
+import os
+import sys
+import unittest
+from unittest import mock
+
+from hmalib.common import config
+from hmalib.lambdas.api import matches
+
+# Enough environ for api_root to import. None of these are contacted at import.
+API_ROOT_ENVIRON = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "THREAT_EXCHANGE_DATA_BUCKET_NAME": "",
+    "THREAT_EXCHANGE_DATA_FOLDER": "",
+    "THREAT_EXCHANGE_PDQ_FILE_EXTENSION": "",
+    "HMA_CONFIG_TABLE": "",
+    "DYNAMODB_TABLE": "",
+    "BANKS_TABLE": "",
+    "IMAGE_BUCKET_NAME": "",
+    "IMAGE_PREFIX": "",
+    "SUBMISSIONS_QUEUE_URL": "",
+    "HASHES_QUEUE_URL": "",
+    "INDEXES_BUCKET_NAME": "indexes-bucket",
+    "WRITEBACKS_QUEUE_URL": "",
+}
+
+
+def _import_api_root(**environ):
+    environ = {**API_ROOT_ENVIRON, **environ}
+    # The sub-APIs call HMAConfig.initialize, which refuses a second table name
+    with mock.patch.dict(os.environ, environ), mock.patch.object(
+        config, "_TABLE_NAME", None
+    ):
+        if "PRELOAD_MATCH_INDEXES" not in environ:
+            os.environ.pop("PRELOAD_MATCH_INDEXES", None)
+        # Import afresh so module-level init runs exactly once under this environ
+        sys.modules.pop("hmalib.lambdas.api.api_root", None)
+        return importlib.import_module("hmalib.lambdas.api.api_root")
+
+
+class PreloadMatchIndexesTestCase(unittest.TestCase):
+    def test_warmup_off_by_default(self):
+        with mock.patch.object(matches, "warmup_matches_api") as warmup:
+            _import_api_root()
+        warmup.assert_not_called()
+
+    def test_warmup_when_enabled(self):
+        with mock.patch.object(matches, "warmup_matches_api") as warmup:
+            _import_api_root(PRELOAD_MATCH_INDEXES="True")
+        warmup.assert_called_once_with("indexes-bucket")
+
+    def test_warmup_skipped_without_bucket(self):
+        with mock.patch.object(matches, "_get_matcher") as get_matcher:
+            matches.warmup_matches_api("")
+        get_matcher.assert_not_called()
+
+
+def _s3_event(*sizes):
+    return {
+        "Records": [
+            {
+                "s3": {
+                    "bucket": {"name": "partner-bucket"},
+                    "object": {"key": f"uploads/{i}.jpg", "size": size},
+                }
+            }
+            for i, size in enumerate(sizes)
+        ]
+    }
+
+
+class ProcessS3EventTestCase(unittest.TestCase):
+    def setUp(self):
+        self.api_root = _import_api_root()
+
+        def patch(name, **kwargs):
+            patcher = mock.patch.object(self.api_root, name, **kwargs)
+            self.addCleanup(patcher.stop)
+            return patcher.start()
+
+        patch(
+            "create_presigned_url",
+            side_effect=lambda bucket, key, *_: f"https://presigned/{bucket}/{key}",
+        )
+        self.record_content_submission = patch("record_content_submission")
+        self.send = patch("send_submissions_to_url_queue")
+
+    def sent_messages(self):
+        return [
+            message for call in self.send.call_args_list for message in call.args[1]
+        ]
+
+    def recorded_content_ids(self):
+        return [call.args[1] for call in self.record_content_submission.call_args_list]
+
+    def test_records_and_queues_each_non_empty_object(self):
+        # 12 non-empty objects, with an empty one (eg. a folder) in the middle
+        self.api_root.process_s3_event(_s3_event(*[1] * 5, 0, *[1] * 7))
+
+        self.assertEqual(self.record_content_submission.call_count, 12)
+        self.assertEqual(
+            [len(call.args[1]) for call in self.send.call_args_list], [10, 2]
+        )
+        for call in self.send.call_args_list:
+            self.assertEqual(call.args[0], self.api_root.SUBMISSIONS_QUEUE_URL)
+
+        messages = self.sent_messages()
+        self.assertEqual(
+            [message.content_id for message in messages], self.recorded_content_ids()
+        )
+        self.assertNotIn(
+            "https://presigned/partner-bucket/uploads/5.jpg",
+            [message.url for message in messages],
+        )
+        self.assertEqual(
+            messages[0].url, "https://presigned/partner-bucket/uploads/0.jpg"
+        )
+
+    def test_recorded_content_is_queued_when_a_later_record_fails(self):
+        self.record_content_submission.side_effect = [None, None, RuntimeError()]
+
+        with self.assertRaises(RuntimeError):
+            self.api_root.process_s3_event(_s3_event(1, 1, 1, 1))
+
+        self.assertEqual(
+            [message.content_id for message in self.sent_messages()],
+            self.recorded_content_ids()[:2],
+        )
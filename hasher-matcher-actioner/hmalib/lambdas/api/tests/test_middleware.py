@@ -54,7 +54,7 @@ class MiddlewareUnitTest(unittest.TestCase):
 
         response = app.get("/response-is-json/")
         self.assertEqual(response.status, "200 OK")
-        self.assertEqual(response.body, b'{"foo": "X", "bar": 10}')
+        self.assertEqual(response.body, b'{"foo":"X","bar":10}')
 
     def test_json_response_body_and_request_payload(self):
         app = TApp(mock_app)
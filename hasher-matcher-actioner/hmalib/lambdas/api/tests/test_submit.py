@@ -0,0 +1,77 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import unittest
+from unittest import mock
+
+import boto3
+from botocore.stub import ANY, Stubber
+from threatexchange.content_type.photo import PhotoContent
+
+from hmalib.common.messages.submit import URLSubmissionMessage
+from hmalib.lambdas.api import submit
+
+QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789012/submissions"
+
+
+def _make_messages(count: int):
+    return [
+        URLSubmissionMessage(
+            content_type=PhotoContent,
+            content_id=f"content-{i}",
+            url=f"https://example.com/{i}.jpg",
+        )
+        for i in range(count)
+    ]
+
+
+class SendSubmissionsToURLQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = boto3.client("sqs", region_name="us-east-1")
+        self.stubber = Stubber(self.client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+
+        patcher = mock.patch.object(submit, "_get_sqs_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def expect_batch(self, size: int, failed=None):
+        self.stubber.add_response(
+            "send_message_batch",
+            {
+                "Successful": [
+                    {"Id": str(i), "MessageId": str(i), "MD5OfMessageBody": "x"}
+                    for i in range(size)
+                    if not failed or str(i) not in {f["Id"] for f in failed}
+                ],
+                "Failed": failed or [],
+            },
+            expected_params={
+                "QueueUrl": QUEUE_URL,
+                "Entries": [{"Id": str(i), "MessageBody": ANY} for i in range(size)],
+            },
+        )
+
+    def test_sends_in_batches_of_ten(self):
+        self.expect_batch(10)
+        self.expect_batch(10)
+        self.expect_batch(3)
+
+        submit.send_submissions_to_url_queue(QUEUE_URL, _make_messages(23))
+
+        self.stubber.assert_no_pending_responses()
+
+    def test_no_messages_makes_no_call(self):
+        # Any call would fail against the stubber, which has no responses queued
+        submit.send_submissions_to_url_queue(QUEUE_URL, [])
+        submit.send_submissions_to_url_queue(QUEUE_URL, iter([]))
+
+    def test_failed_entry_raises_with_content_id(self):
+        self.expect_batch(10)
+        self.expect_batch(
+            3,
+            failed=[{"Id": "1", "SenderFault": False, "Code": "InternalError"}],
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "content-11"):
+            submit.send_submissions_to_url_queue(QUEUE_URL, _make_messages(13))
@@ -20,7 +20,7 @@ from threatexchange.api import ThreatExchangeAPI
 from threatexchange.signal_type.pdq import PdqSignal
 from threatexchange.signal_type.md5 import VideoMD5Signal
 
-from hmalib.aws_secrets import AWSSecrets
+from hmalib import aws_secrets
 from hmalib.common.config import HMAConfig
 from hmalib.common.logging import get_logger
 from hmalib.common.configs.fetcher import ThreatExchangeConfig
@@ -104,7 +104,7 @@ def lambda_handler(event, context):
     data = f"Triggered at time {current_time}, found {len(collabs)} collabs: {', '.join(names)}"
     logger.info(data)
 
-    api_key = AWSSecrets().te_api_key()
+    api_key = aws_secrets.te_api_key()
     api = ThreatExchangeAPI(api_key)
 
     for collab in collabs:
@@ -0,0 +1,30 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import base64
+import unittest
+from unittest import mock
+
+import boto3
+from botocore.stub import Stubber
+
+from hmalib import aws_secrets
+
+
+class GetBinSecretTestCase(unittest.TestCase):
+    def test_fetches_named_secret_and_decodes(self):
+        client = boto3.client("secretsmanager", region_name="us-east-1")
+        secret_bytes = b"\x00\x01not-a-real-secret"
+
+        with Stubber(client) as stubber, mock.patch.object(
+            aws_secrets, "_get_secrets_client", return_value=client
+        ):
+            stubber.add_response(
+                "get_secret_value",
+                {"SecretBinary": base64.b64encode(secret_bytes)},
+                expected_params={"SecretId": "my-binary-secret"},
+            )
+
+            self.assertEqual(
+                aws_secrets._get_bin_secret("my-binary-secret"), secret_bytes
+            )
+            stubber.assert_no_pending_responses()
@@ -13,7 +13,7 @@ from hmalib.common.messages.writeback import WritebackMessage
 from hmalib.common.configs.fetcher import ThreatExchangeConfig
 from hmalib.common.mocks import MockedThreatExchangeAPI
 
-from hmalib.aws_secrets import AWSSecrets
+from hmalib import aws_secrets
 
 from threatexchange.api import ThreatExchangeAPI
 
@@ -157,7 +157,7 @@ class ThreatExchangeWritebacker(Writebacker):
         mock_te_api = os.environ.get("MOCK_TE_API")
         if mock_te_api == "True":
             return MockedThreatExchangeAPI()
-        api_key = AWSSecrets().te_api_key()
+        api_key = aws_secrets.te_api_key()
         return ThreatExchangeAPI(api_key)
 
     def my_descriptor_from_all_descriptors(
@@ -47,6 +47,7 @@ resource "aws_lambda_function" "api_root" {
       INDEXES_BUCKET_NAME                   = var.index_data_storage.bucket_name
       THREAT_EXCHANGE_API_TOKEN_SECRET_NAME = var.te_api_token_secret.name
       MEASURE_PERFORMANCE                   = var.measure_performance ? "True" : "False"
+      PRELOAD_MATCH_INDEXES                 = var.preload_match_indexes ? "True" : "False"
       WRITEBACKS_QUEUE_URL                  = var.writebacks_queue.url
       SUBMISSIONS_QUEUE_URL                 = var.submissions_queue.url
       HASHES_QUEUE_URL                      = var.hashes_queue.url
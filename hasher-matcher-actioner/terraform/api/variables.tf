@@ -122,6 +122,12 @@ variable "measure_performance" {
   default     = false
 }
 
+variable "preload_match_indexes" {
+  description = "Download the match indexes while the API lambda initializes instead of on the first /matches/ request. Adds time and memory to every cold start."
+  type        = bool
+  default     = false
+}
+
 variable "writebacks_queue" {
   description = "ARN and url to send writebacks to"
   type = object({
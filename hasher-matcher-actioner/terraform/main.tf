@@ -424,6 +424,7 @@ module "api" {
   additional_tags              = merge(var.additional_tags, local.common_tags)
   config_table                 = local.config_table
   measure_performance          = var.measure_performance
+  preload_match_indexes        = var.preload_match_indexes
   te_api_token_secret          = aws_secretsmanager_secret.te_api_token
   hma_api_access_tokens_secret = aws_secretsmanager_secret.hma_api_tokens
 
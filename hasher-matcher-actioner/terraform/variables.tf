@@ -28,6 +28,12 @@ variable "measure_performance" {
   default     = false
 }
 
+variable "preload_match_indexes" {
+  description = "Download the match indexes while the API lambda initializes instead of on the first /matches/ request. Adds time and memory to every cold start."
+  type        = bool
+  default     = false
+}
+
 variable "metrics_namespace" {
   description = "Cloudwatch namespace for metrics."
   type        = string